@@ -1,39 +1,103 @@
+import asyncio
 import json
+import os
+import orjson
 import requests
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import string
-import difflib
+import functools
+import threading
 from collections import deque
-from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import SentenceTransformerEmbeddings
+from concurrent.futures import ThreadPoolExecutor
+from rapidfuzz import process, fuzz
 
 # --- Configurações Iniciais ---
-with open("pokedex_gen1.json", encoding="utf-8") as f:
-    cache_local = json.load(f)
+with open("pokedex_gen1.json", "rb") as f:
+    cache_local = orjson.loads(f.read())
 
 NOMES_VALIDOS = [p["nome"].lower() for p in cache_local]
+NOMES_VALIDOS_SET = frozenset(NOMES_VALIDOS)
+CACHE_BY_NOME = {p["nome"].lower(): p for p in cache_local}
 CORRECOES_API = {
     "nidoran(f)": "nidoran-f",
     "nidoran(m)": "nidoran-m",
     "mr. mime": "mr-mime",
     "farfetch'd": "farfetchd"
 }
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_PALAVRA_RE = re.compile(r"[a-z]+(?:-[a-z]+)*")
 
-# Inicializa vetor de embeddings
-embedding = SentenceTransformerEmbeddings(model_name="all-MiniLM-L6-v2")
-db = Chroma(persist_directory="db", embedding_function=embedding)
+# Sessão HTTP reutilizável (keep-alive) para as chamadas à PokéAPI
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Cache em disco das respostas da PokéAPI (os dados praticamente não mudam)
+CACHE_API_PATH = "pokeapi_cache.json"
+_cache_api_lock = threading.Lock()
+
+def carregar_cache_api() -> dict:
+    try:
+        with open(CACHE_API_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def salvar_cache_api(nome_api: str, dados: dict):
+    with _cache_api_lock:
+        cache_api[nome_api] = dados
+        # Grava num arquivo temporário e troca de uma vez, para não truncar o cache se o processo cair
+        caminho_tmp = CACHE_API_PATH + ".tmp"
+        with open(caminho_tmp, "w", encoding="utf-8") as f:
+            json.dump(cache_api, f, ensure_ascii=False)
+        os.replace(caminho_tmp, CACHE_API_PATH)
+
+cache_api = carregar_cache_api()
+
+# Base vetorizada carregada só no primeiro uso (modelo + Chroma são pesados)
+# Ainda sem chamadas: a busca semântica não está ligada ao responder()
+@functools.lru_cache(maxsize=1)
+def _get_db():
+    from langchain_community.vectorstores import Chroma
+    from embeddings_onnx import OnnxMiniLMEmbeddings, MODELO_INT8
+
+    # Usa o MiniLM int8 (ONNX) se já foi gerado com scripts/embeddings_onnx.py
+    if os.path.exists(MODELO_INT8):
+        embedding = OnnxMiniLMEmbeddings(MODELO_INT8)
+    else:
+        from langchain_community.embeddings import SentenceTransformerEmbeddings
+        embedding = SentenceTransformerEmbeddings(model_name="all-MiniLM-L6-v2")
+    return Chroma(persist_directory="db", embedding_function=embedding)
 
 # --- Memória de Conversa ---
 class MemoriaConversa:
     def __init__(self):
         self.historico = deque(maxlen=3)
         self.ultimo_pokemon = None
+        self.ultimos_dois = deque(maxlen=2)
+        self._contexto_cache = None
+    
+    def registrar_pokemon(self, nome: str):
+        # Mantém os dois últimos Pokémon distintos citados (para comparações)
+        if nome in self.ultimos_dois:
+            self.ultimos_dois.remove(nome)
+        self.ultimos_dois.append(nome)
     
     def adicionar(self, pergunta: str, resposta: str):
         self.historico.append((pergunta, resposta))
+        self._contexto_cache = None
     
     def contexto(self) -> str:
-        return "\n".join([f"Q: {q}\nA: {a}" for q, a in self.historico])
+        if self._contexto_cache is None:
+            self._contexto_cache = "\n".join([f"Q: {q}\nA: {a}" for q, a in self.historico])
+        return self._contexto_cache
 
 memoria = MemoriaConversa()
 
@@ -41,164 +105,219 @@ memoria = MemoriaConversa()
 def corrigir_capitalizacao(texto):
     return ' '.join([palavra.capitalize() for palavra in texto.split()])
 
+@functools.lru_cache(maxsize=512)
 def limpar_nome(nome):
-    return nome.translate(str.maketrans('', '', string.punctuation)).strip()
+    return nome.translate(_PUNCT_TABLE).strip()
 
+@functools.lru_cache(maxsize=512)
 def corrigir_nome_pokemon(nome_digitado):
-    sugestao = difflib.get_close_matches(nome_digitado.lower(), NOMES_VALIDOS, n=1)
-    return sugestao[0] if sugestao else nome_digitado.lower()
+    nome = nome_digitado.lower()
+    if nome in NOMES_VALIDOS_SET:
+        return nome
+    sugestao = process.extractOne(nome, NOMES_VALIDOS, scorer=fuzz.ratio, score_cutoff=60)
+    return sugestao[0] if sugestao else nome
 
+@functools.lru_cache(maxsize=512)
 def normalizar_nome_para_api(nome):
     nome_limpo = nome.lower().strip()
     nome_limpo = CORRECOES_API.get(nome_limpo, nome_limpo)
     return nome_limpo.replace(" ", "-").replace(".", "").replace("'", "")
 
 def extrair_nomes_de_pokemon(texto):
-    palavras = texto.split()
-    nomes_detectados = []
-    for palavra in palavras:
-        palavra_limpa = limpar_nome(palavra).lower()
-        if palavra_limpa in NOMES_VALIDOS:
-            nomes_detectados.append(palavra.capitalize())
-    return nomes_detectados
+    # Apóstrofos saem antes (o Pokédex guarda "farfetchd"); hífen só entre letras (nidoran-f, mr-mime)
+    texto = texto.lower().replace("'", "")
+    return [palavra.capitalize() for palavra in _PALAVRA_RE.findall(texto) if palavra in NOMES_VALIDOS_SET]
+
+# Ordem de prioridade das intenções (a primeira encontrada vence)
+INTENCOES = [
+    ('ataque', r'ataque|poder|força|dano'),
+    ('defesa', r'defesa|proteção|resistência'),
+    ('tipo', r'tipos?|elemento'),
+    ('habilidade', r'habilidades?|poderes?'),
+    ('evolucao', r'evolução|evolui'),
+    ('fraqueza', r'fraquezas?|vulnerabilidades?|contra|fracos?'),
+    ('localizacao', r'local|encontrar|onde acha|habitat'),
+    ('comparar', r'comparar|vs|versus|mais forte|quem ganha'),
+]
+_INTENT_RE = re.compile('|'.join(rf'\b(?P<{nome}>{padrao})\b' for nome, padrao in INTENCOES))
 
 def detectar_intencao(pergunta: str) -> str:
-    pergunta = pergunta.lower()
-    if re.search(r'\b(ataque|poder|força|dano)\b', pergunta):
-        return 'ataque'
-    elif re.search(r'\b(defesa|proteção|resistência)\b', pergunta):
-        return 'defesa'
-    elif re.search(r'\b(tipos?|elemento)\b', pergunta):
-        return 'tipo'
-    elif re.search(r'\b(habilidades?|poderes?)\b', pergunta):
-        return 'habilidade'
-    elif re.search(r'\b(evolução|evolui)\b', pergunta):
-        return 'evolucao'
-    elif re.search(r'\b(fraquezas?|vulnerabilidades?|contra|fracos?)\b', pergunta):
-        return 'fraqueza'
-    elif re.search(r'\b(local|encontrar|onde acha|habitat)\b', pergunta):
-        return 'localizacao'
-    elif re.search(r'\b(comparar|vs|versus|mais forte|quem ganha)\b', pergunta):
-        return 'comparar'
-    else:
-        return 'geral'
+    encontradas = {m.lastgroup for m in _INTENT_RE.finditer(pergunta.lower())}
+    return next((nome for nome, _ in INTENCOES if nome in encontradas), 'geral')
 
 # --- Sistema de cálculo de fraquezas ---
-def calcular_fraquezas(tipos: list) -> dict:
-    # Mapeamento simplificado de fraquezas (pode ser expandido)
-    tabela_tipos = {
-        'Fire': {'Water', 'Rock', 'Ground'},
-        'Water': {'Electric', 'Grass'},
-        'Electric': {'Ground'},
-        'Grass': {'Fire', 'Ice', 'Poison', 'Flying', 'Bug'},
-        'Ice': {'Fire', 'Fighting', 'Rock', 'Steel'},
-        'Fighting': {'Flying', 'Psychic', 'Fairy'},
-        'Poison': {'Ground', 'Psychic'},
-        'Ground': {'Water', 'Grass', 'Ice'},
-        'Flying': {'Electric', 'Ice', 'Rock'},
-        'Psychic': {'Bug', 'Ghost', 'Dark'},
-        'Bug': {'Fire', 'Flying', 'Rock'},
-        'Rock': {'Water', 'Grass', 'Fighting', 'Ground', 'Steel'},
-        'Ghost': {'Ghost', 'Dark'},
-        'Dragon': {'Ice', 'Dragon', 'Fairy'},
-        'Dark': {'Fighting', 'Bug', 'Fairy'},
-        'Steel': {'Fire', 'Fighting', 'Ground'},
-        'Fairy': {'Poison', 'Steel'}
-    }
-    
-    fraquezas = set()
+# Mapeamento simplificado de fraquezas (pode ser expandido)
+FRAQUEZAS_POR_TIPO = {
+    'Fire': {'Water', 'Rock', 'Ground'},
+    'Water': {'Electric', 'Grass'},
+    'Electric': {'Ground'},
+    'Grass': {'Fire', 'Ice', 'Poison', 'Flying', 'Bug'},
+    'Ice': {'Fire', 'Fighting', 'Rock', 'Steel'},
+    'Fighting': {'Flying', 'Psychic', 'Fairy'},
+    'Poison': {'Ground', 'Psychic'},
+    'Ground': {'Water', 'Grass', 'Ice'},
+    'Flying': {'Electric', 'Ice', 'Rock'},
+    'Psychic': {'Bug', 'Ghost', 'Dark'},
+    'Bug': {'Fire', 'Flying', 'Rock'},
+    'Rock': {'Water', 'Grass', 'Fighting', 'Ground', 'Steel'},
+    'Ghost': {'Ghost', 'Dark'},
+    'Dragon': {'Ice', 'Dragon', 'Fairy'},
+    'Dark': {'Fighting', 'Bug', 'Fairy'},
+    'Steel': {'Fire', 'Fighting', 'Ground'},
+    'Fairy': {'Poison', 'Steel'}
+}
+
+# Cada tipo vira um bit (em ordem alfabética); as fraquezas de um tipo viram uma máscara
+TIPOS = sorted(set(FRAQUEZAS_POR_TIPO).union(*FRAQUEZAS_POR_TIPO.values()))
+TIPO_IDX = {tipo: i for i, tipo in enumerate(TIPOS)}
+TABELA_TIPOS = {
+    tipo: sum(1 << TIPO_IDX[fraqueza] for fraqueza in fraquezas)
+    for tipo, fraquezas in FRAQUEZAS_POR_TIPO.items()
+}
+
+def calcular_fraquezas(tipos: list) -> list:
+    mascara = 0
     for tipo in tipos:
-        if tipo in tabela_tipos:
-            fraquezas.update(tabela_tipos[tipo])
-    
-    return sorted(fraquezas)
+        mascara |= TABELA_TIPOS.get(tipo, 0)
+    return [tipo for i, tipo in enumerate(TIPOS) if mascara >> i & 1]
 
 # --- Sistema de Busca (RAG) ---
+def extrair_evolucoes(chain: dict, ignorar: str) -> list:
+    # Percorre a cadeia evolutiva em pré-ordem (mesma ordem da versão recursiva)
+    evolucoes = []
+    pilha = [chain]
+    while pilha:
+        no = pilha.pop()
+        nome_evo = no["species"]["name"].capitalize()
+        if nome_evo.lower() != ignorar:
+            evolucoes.append(nome_evo)
+        pilha.extend(reversed(no.get("evolves_to", [])))
+    return evolucoes
+
+def resolver_nome_api(nome) -> tuple:
+    nome_corrigido = corrigir_nome_pokemon(limpar_nome(nome))
+    return nome_corrigido, normalizar_nome_para_api(nome_corrigido)
+
+def montar_dados_api(nome_corrigido: str, poke_data: dict, species_data: dict, chain_data: dict) -> dict:
+    # Processar dados básicos
+    stats = {stat["stat"]["name"]: stat["base_stat"] for stat in poke_data.get("stats", [])}
+    
+    # Processar descrição
+    descricao = "Descrição não disponível."
+    if species_data:
+        descricao = next(
+            (entry["flavor_text"].replace('\n', ' ') 
+            for entry in species_data["flavor_text_entries"] 
+            if entry["language"]["name"] == "en"),
+            "Descrição não encontrada."
+        )
+    
+    # Processar evolução
+    evolucao = ["Não evolui"]
+    if chain_data:
+        evolucoes = extrair_evolucoes(chain_data["chain"], nome_corrigido)
+        if evolucoes:
+            evolucao = evolucoes
+
+    return {
+        "nome": nome_corrigido.capitalize(),
+        "tipos": [t["type"]["name"].capitalize() for t in poke_data.get("types", [])],
+        "habilidades": [h["ability"]["name"].capitalize() for h in poke_data.get("abilities", [])],
+        "altura": poke_data.get("height", 0) / 10,
+        "peso": poke_data.get("weight", 0) / 10,
+        "stats": stats,
+        "descricao": descricao,
+        "evolucao": evolucao,
+        "fonte": "PokéAPI"
+    }
+
 def buscar_na_pokeapi(nome) -> dict:
     try:
-        nome_limpo = limpar_nome(nome)
-        nome_corrigido = corrigir_nome_pokemon(nome_limpo)
-        nome_api = normalizar_nome_para_api(nome_corrigido)
+        nome_corrigido, nome_api = resolver_nome_api(nome)
+        if nome_api in cache_api:
+            return cache_api[nome_api]
 
         poke_url = f"https://pokeapi.co/api/v2/pokemon/{nome_api}"
         species_url = f"https://pokeapi.co/api/v2/pokemon-species/{nome_api}"
 
-        poke_response = requests.get(poke_url, timeout=5)
+        # Pokémon e espécie dependem só do nome: busca os dois em paralelo
+        poke_future = EXECUTOR.submit(SESSION.get, poke_url, timeout=5)
+        species_future = EXECUTOR.submit(SESSION.get, species_url, timeout=5)
+        poke_response = poke_future.result()
+        species_response = species_future.result()
         if poke_response.status_code != 200:
             return None
 
-        poke_data = poke_response.json()
-        
-        # Processar dados básicos
-        stats = {stat["stat"]["name"]: stat["base_stat"] for stat in poke_data.get("stats", [])}
-        
-        # Processar descrição
-        descricao = "Descrição não disponível."
-        species_response = requests.get(species_url, timeout=5)
+        species_data = chain_data = None
         if species_response.status_code == 200:
             species_data = species_response.json()
-            descricao = next(
-                (entry["flavor_text"].replace('\n', ' ') 
-                for entry in species_data["flavor_text_entries"] 
-                if entry["language"]["name"] == "en"),
-                "Descrição não encontrada."
-            )
-            
-            # Processar evolução
-            evolucao = ["Não evolui"]
             if "evolution_chain" in species_data:
-                chain_url = species_data["evolution_chain"]["url"]
-                chain_data = requests.get(chain_url, timeout=5).json()
-                if chain_data:
-                    evolucoes = []
-                    def extrair_evolucoes(chain):
-                        nome_evo = chain["species"]["name"].capitalize()
-                        if nome_evo.lower() != nome_corrigido:
-                            evolucoes.append(nome_evo)
-                        for evo in chain.get("evolves_to", []):
-                            extrair_evolucoes(evo)
-                    extrair_evolucoes(chain_data["chain"])
-                    if evolucoes:
-                        evolucao = evolucoes
-
-        return {
-            "nome": nome_corrigido.capitalize(),
-            "tipos": [t["type"]["name"].capitalize() for t in poke_data.get("types", [])],
-            "habilidades": [h["ability"]["name"].capitalize() for h in poke_data.get("abilities", [])],
-            "altura": poke_data.get("height", 0) / 10,
-            "peso": poke_data.get("weight", 0) / 10,
-            "stats": stats,
-            "descricao": descricao,
-            "evolucao": evolucao,
-            "fonte": "PokéAPI"
-        }
+                chain_data = SESSION.get(species_data["evolution_chain"]["url"], timeout=5).json()
+
+        dados = montar_dados_api(nome_corrigido, poke_response.json(), species_data, chain_data)
+        salvar_cache_api(nome_api, dados)
+        return dados
+
+    except Exception:
+        return None
+
+# Versão assíncrona (aiohttp) usada pela interface Gradio
+async def _aget_json(session: aiohttp.ClientSession, url: str) -> dict:
+    async with session.get(url) as response:
+        if response.status != 200:
+            return None
+        return await response.json()
+
+async def abuscar_na_pokeapi(nome, session: aiohttp.ClientSession) -> dict:
+    try:
+        nome_corrigido, nome_api = resolver_nome_api(nome)
+        if nome_api in cache_api:
+            return cache_api[nome_api]
+
+        poke_data, species_data = await asyncio.gather(
+            _aget_json(session, f"https://pokeapi.co/api/v2/pokemon/{nome_api}"),
+            _aget_json(session, f"https://pokeapi.co/api/v2/pokemon-species/{nome_api}")
+        )
+        if not poke_data:
+            return None
+
+        chain_data = None
+        if species_data and "evolution_chain" in species_data:
+            chain_data = await _aget_json(session, species_data["evolution_chain"]["url"])
+
+        dados = montar_dados_api(nome_corrigido, poke_data, species_data, chain_data)
+        # A escrita do arquivo (e o lock) não podem travar o event loop
+        await asyncio.to_thread(salvar_cache_api, nome_api, dados)
+        return dados
 
     except Exception:
         return None
 
 def buscar_no_json(nome) -> dict:
     nome_corrigido = corrigir_nome_pokemon(limpar_nome(nome))
-    for poke in cache_local:
-        if poke.get("nome", "").lower() == nome_corrigido:
-            return {
-                "nome": poke["nome"],
-                "tipos": poke.get("tipos", []),
-                "habilidades": poke.get("habilidades", []),
-                "altura": poke.get("altura", "N/A"),
-                "peso": poke.get("peso", "N/A"),
-                "stats": {
-                    "hp": poke["stats"].get("hp"),
-                    "attack": poke["stats"].get("ataque"),
-                    "defense": poke["stats"].get("defesa"),
-                    "special-attack": poke["stats"].get("ataque_especial"),
-                    "special-defense": poke["stats"].get("defesa_especial"),
-                    "speed": poke["stats"].get("velocidade")
-                },
-                "descricao": poke.get("descricao", "Descrição não disponível."),
-                "evolucao": poke.get("evolucao", ["Não evolui"]),
-                "fonte": "Cache Local"
-            }
-    return None
+    poke = CACHE_BY_NOME.get(nome_corrigido)
+    # Entradas resumidas (sem "stats", descrição e evolução) ficam para a PokéAPI
+    if not poke or "stats" not in poke:
+        return None
+    return {
+        "nome": poke["nome"],
+        "tipos": poke.get("tipos", []),
+        "habilidades": poke.get("habilidades", []),
+        "altura": poke.get("altura", "N/A"),
+        "peso": poke.get("peso", "N/A"),
+        "stats": {
+            "hp": poke["stats"].get("hp"),
+            "attack": poke["stats"].get("ataque"),
+            "defense": poke["stats"].get("defesa"),
+            "special-attack": poke["stats"].get("ataque_especial"),
+            "special-defense": poke["stats"].get("defesa_especial"),
+            "speed": poke["stats"].get("velocidade")
+        },
+        "descricao": poke.get("descricao", "Descrição não disponível."),
+        "evolucao": poke.get("evolucao") or ["Não evolui"],
+        "fraquezas": poke.get("fraquezas", []),
+        "fonte": "Cache Local"
+    }
 
 # --- Gerador de Respostas ---
 def gerar_resposta(intencao: str, dados: dict) -> str:
@@ -220,7 +339,8 @@ def gerar_resposta(intencao: str, dados: dict) -> str:
         return f"🔮 {nome} evolui para: {', '.join(dados['evolucao'])}"
     
     elif intencao == 'fraqueza':
-        fraquezas = calcular_fraquezas(dados['tipos'])
+        # O cache local já traz as fraquezas (com os tipos em português)
+        fraquezas = dados.get('fraquezas') or calcular_fraquezas(dados['tipos'])
         return f"⚠️ {nome} é fraco contra: {', '.join(fraquezas) if fraquezas else 'Nenhum tipo em especial'}"
     
     elif intencao == 'localizacao':
@@ -235,13 +355,10 @@ def gerar_resposta(intencao: str, dados: dict) -> str:
         return f"🗺️ {nome} pode ser encontrado em: {local}"
     
     elif intencao == 'comparar':
-        contexto = memoria.contexto()
-        pokemons = re.findall(r'[A-Z][a-z]+', contexto)
-        
-        if len(pokemons) >= 2:
-            poke1, poke2 = pokemons[:2]
-            dados1 = buscar_na_pokeapi(poke1) or buscar_no_json(poke1)
-            dados2 = buscar_na_pokeapi(poke2) or buscar_no_json(poke2)
+        if len(memoria.ultimos_dois) == 2:
+            poke1, poke2 = memoria.ultimos_dois
+            dados1 = buscar_no_json(poke1) or buscar_na_pokeapi(poke1)
+            dados2 = buscar_no_json(poke2) or buscar_na_pokeapi(poke2)
             
             if dados1 and dados2:
                 comparacao = []
@@ -288,6 +405,8 @@ def responder(pergunta):
     
     # Extrair nomes de Pokémon
     nomes_detectados = extrair_nomes_de_pokemon(pergunta)
+    for nome in nomes_detectados:
+        memoria.registrar_pokemon(nome)
     
     # Se não detectar nomes, verifica no histórico
     if not nomes_detectados and memoria.ultimo_pokemon:
@@ -301,12 +420,10 @@ def responder(pergunta):
     if not nomes_detectados:
         return "❓ Não identifiquei um Pokémon na sua pergunta. Poderia ser mais específico?"
     
-    # Busca dados (RAG)
+    # Busca dados (RAG): cache local primeiro, PokéAPI como fallback
     dados = None
     for nome in nomes_detectados:
-        dados = buscar_na_pokeapi(nome)
-        if not dados:
-            dados = buscar_no_json(nome)
+        dados = buscar_no_json(nome) or buscar_na_pokeapi(nome)
         if dados:
             memoria.ultimo_pokemon = dados["nome"]
             break
@@ -320,6 +437,17 @@ def responder(pergunta):
     
     return resposta
 
+async def aresponder(pergunta):
+    # Busca na PokéAPI, sem bloquear o event loop, os nomes que não estão no cache local
+    nomes = [nome for nome in extrair_nomes_de_pokemon(pergunta) if not buscar_no_json(nome)]
+    if nomes:
+        # Sessão por pergunta: fechada ao fim dela, sem sessão global aberta até o encerramento do app
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            await asyncio.gather(*(abuscar_na_pokeapi(nome, session) for nome in nomes))
+    # responder() ainda pode bloquear (input(), escrita do cache, nova tentativa síncrona
+    # na PokéAPI se o prefetch falhar), então roda numa thread e não no event loop
+    return await asyncio.to_thread(responder, pergunta)
+
 # --- Interface Gradio ---
 if __name__ == "__main__":
     import gradio as gr
@@ -335,8 +463,8 @@ if __name__ == "__main__":
         msg = gr.Textbox(label="Pergunte sobre um Pokémon")
         clear = gr.Button("Limpar")
         
-        def respond(pergunta, chat_historico):
-            resposta = responder(pergunta)
+        async def respond(pergunta, chat_historico):
+            resposta = await aresponder(pergunta)
             chat_historico.append((pergunta, resposta))
             return "", chat_historico
         
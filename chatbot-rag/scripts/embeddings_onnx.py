@@ -0,0 +1,72 @@
+import os
+import inspect
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+MODELO_HF = "sentence-transformers/all-MiniLM-L6-v2"
+PASTA_ONNX = "models"
+MODELO_FP32 = os.path.join(PASTA_ONNX, "minilm.onnx")
+MODELO_INT8 = os.path.join(PASTA_ONNX, "minilm-int8.onnx")
+
+# Embeddings do all-MiniLM-L6-v2 quantizado (int8) rodando no onnxruntime
+class OnnxMiniLMEmbeddings(Embeddings):
+    def __init__(self, caminho_modelo: str = MODELO_INT8, batch_size: int = 64):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(MODELO_HF)
+        self.session = ort.InferenceSession(caminho_modelo, providers=["CPUExecutionProvider"])
+        self.entradas = {i.name for i in self.session.get_inputs()}
+        self.batch_size = batch_size
+
+    def _encode(self, textos: list) -> np.ndarray:
+        tokens = self.tokenizer(textos, padding=True, truncation=True, max_length=256, return_tensors="np")
+        feed = {k: v.astype(np.int64) for k, v in tokens.items() if k in self.entradas}
+        saida = self.session.run(None, feed)[0]
+
+        # Mean pooling sobre os tokens válidos + normalização L2
+        mascara = tokens["attention_mask"][..., None].astype(np.float32)
+        vetores = (saida * mascara).sum(axis=1) / np.clip(mascara.sum(axis=1), 1e-9, None)
+        return vetores / np.linalg.norm(vetores, axis=1, keepdims=True)
+
+    def embed_documents(self, texts: list) -> list:
+        # Ordena por tamanho para que cada lote tenha o mínimo de padding
+        ordem = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vetores = [None] * len(texts)
+        for inicio in range(0, len(ordem), self.batch_size):
+            lote = ordem[inicio:inicio + self.batch_size]
+            for i, vetor in zip(lote, self._encode([texts[i] for i in lote])):
+                vetores[i] = vetor.tolist()
+        return vetores
+
+    def embed_query(self, text: str) -> list:
+        return self._encode([text])[0].tolist()
+
+def exportar_modelo_quantizado():
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    os.makedirs(PASTA_ONNX, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(MODELO_HF)
+    modelo = AutoModel.from_pretrained(MODELO_HF).eval()
+    exemplo = tokenizer(["Pikachu é do tipo elétrico"], return_tensors="pt")
+
+    # Força o exportador clássico (TorchScript); nas versões novas o padrão (dynamo) exige onnxscript
+    opcoes = {"dynamo": False} if "dynamo" in inspect.signature(torch.onnx.export).parameters else {}
+    eixos = {0: "batch", 1: "tokens"}
+    torch.onnx.export(
+        modelo,
+        (exemplo["input_ids"], exemplo["attention_mask"], exemplo["token_type_ids"]),
+        MODELO_FP32,
+        input_names=["input_ids", "attention_mask", "token_type_ids"],
+        output_names=["last_hidden_state"],
+        dynamic_axes={nome: eixos for nome in ["input_ids", "attention_mask", "token_type_ids", "last_hidden_state"]},
+        opset_version=14,
+        **opcoes
+    )
+    quantize_dynamic(MODELO_FP32, MODELO_INT8, weight_type=QuantType.QInt8)
+    print(f"✅ Modelo quantizado salvo em '{MODELO_INT8}'!")
+
+if __name__ == "__main__":
+    exportar_modelo_quantizado()